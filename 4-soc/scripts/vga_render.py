@@ -6,44 +6,134 @@ Supports both text-mode (ANSI colors) and image export (PNG)
 """
 
 import argparse
+import mmap
+import queue
 import re
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    print(
+        "Error: NumPy not installed. Install with: pip install numpy",
+        file=sys.stderr,
+    )
+    sys.exit(1)
+
+# Pillow is only needed for PNG export
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Numba is optional; without it the value-change scan runs in pure Python
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Signal kind codes used by the value-change dispatch. Frame boundaries
+# (vsync) are located up front, so the decoders only track these.
+KIND_ACTIVE = 0
+KIND_COLOR = 1
+KIND_X = 2
+KIND_Y = 3
+
+# The JIT scanner packs signal IDs into an int64, one byte per character
+MAX_PACKED_ID_LEN = 8
+
+# One value change per line: scalar "0~#" (bit, id) or vector "b101010 $"
+# (value, id). Timestamp markers ("#123") and directives do not match.
+_VALUE_CHANGE_RE = re.compile(
+    rb"^(?:([01])|b([01]*)[ \t]+)(\S+)[ \t]*\r?(?:\n|\Z)", re.MULTILINE
+)
 
 
 class VCDParser:
     """Lightweight VCD parser for VGA signals"""
 
-    def __init__(self, vcd_path: str):
+    def __init__(
+        self, vcd_path: str, width: int = 640, height: int = 480, scale: int = 1
+    ):
         self.vcd_path = vcd_path
+        self.width = width
+        self.height = height
+        # Only every scale-th pixel in each direction is kept
+        self.scale = scale
+        self.frame_shape = (-(-height // scale), -(-width // scale))
         self.signals = {}
         self.signal_ids = {}
-
-    def parse_header(self):
-        """Parse VCD header to extract signal identifiers"""
-        with open(self.vcd_path, "r") as f:
-            for line in f:
-                if line.startswith("$var") or line.strip().startswith("$var"):
-                    # $var wire 1 ~# io_vga_hsync $end
-                    # Handle both with/without leading spaces
-                    line = line.strip()
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        sig_id = parts[3]
-                        sig_name = parts[4]
-                        # Only keep top-level io_vga signals, not internal vga_ signals
-                        if sig_name.startswith("io_vga_"):
-                            self.signal_ids[sig_name] = sig_id
-                            self.signals[sig_id] = {"name": sig_name, "value": "0"}
-                if "$enddefinitions" in line:
-                    break
-
-    def extract_frames(self, max_pixels: int = 100000):
-        """Extract VGA pixel data from VCD trace"""
-        if not self.signal_ids:
-            self.parse_header()
-
+        # (N, *frame_shape) RRGGBB codes, filled in by extract_frames
+        self.frames = np.zeros((0, *self.frame_shape), dtype=np.uint8)
+        # Per frame: pixels written, then min x, min y, max x, max y of the
+        # written pixels in VGA coordinates
+        self.extents = np.zeros((0, 5), dtype=np.int64)
+        # True once extract_frames has decoded the trace to its end
+        self.complete = False
+        # Signal ID -> kind code, filled in by extract_frames
+        self._kinds = {}
+        self._data_offset = 0
+        self._eol = b"\n"
+
+    def parse_header(self, mm: mmap.mmap) -> int:
+        """
+        Parse VCD header to extract signal identifiers. Returns the offset of
+        the first value-change line, which is also cached as _data_offset.
+        """
+        mm.seek(0)
+        self._data_offset = len(mm)
+        while True:
+            line = mm.readline()
+            if not line:
+                break
+            if line.endswith(b"\r\n"):
+                self._eol = b"\r\n"
+            # $var wire 1 ~# io_vga_hsync $end
+            # Handle both with/without leading spaces
+            line = line.strip()
+            if line.startswith(b"$var"):
+                parts = line.split()
+                if len(parts) >= 5:
+                    sig_id = parts[3]
+                    sig_name = parts[4].decode("ascii", "replace")
+                    # Only keep top-level io_vga signals, not internal vga_ signals
+                    if sig_name.startswith("io_vga_"):
+                        self.signal_ids[sig_name] = sig_id
+                        self.signals[sig_id] = {"name": sig_name, "value": b"0"}
+            if b"$enddefinitions" in line:
+                self._data_offset = mm.tell()
+                break
+        return self._data_offset
+
+    def extract_frames(
+        self, max_frames: Optional[int] = None, jobs: int = 1
+    ) -> np.ndarray:
+        """Extract VGA frames from VCD trace as an (N, *frame_shape) RRGGBB array"""
+        for _ in self.iter_frames(max_frames, jobs):
+            pass
+        return self.frames
+
+    def iter_frames(
+        self, max_frames: Optional[int] = None, jobs: int = 1
+    ) -> Iterator[np.ndarray]:
+        """
+        Yield VGA frames as frame_shape RRGGBB arrays while they are
+        decoded. Once the iterator is exhausted, self.frames holds them all.
+        """
+        with open(self.vcd_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            if not self.signal_ids:
+                self.parse_header(mm)
+            yield from self._iter_frames(mm, max_frames, jobs)
+
+    def _iter_frames(
+        self, mm: mmap.mmap, max_frames: Optional[int], jobs: int
+    ) -> Iterator[np.ndarray]:
         # VGA signal IDs
         hsync_id = self.signal_ids.get("io_vga_hsync")
         vsync_id = self.signal_ids.get("io_vga_vsync")
@@ -55,194 +145,543 @@ class VCDParser:
         if not all([hsync_id, vsync_id, active_id, color_id]):
             print(f"Error: Missing VGA signals in VCD file", file=sys.stderr)
             print(f"Found signals: {list(self.signal_ids.keys())}", file=sys.stderr)
-            return []
+            return
 
         print(
-            f"VGA signal IDs: hsync={hsync_id}, vsync={vsync_id}, active={active_id}, color={color_id}"
+            f"VGA signal IDs: hsync={hsync_id.decode()}, vsync={vsync_id.decode()}, "
+            f"active={active_id.decode()}, color={color_id.decode()}"
         )
 
-        frames = []
-        current_frame = {}
+        # Signal ID -> kind code, so the hot loop does one lookup per event
+        self._kinds = {
+            sig_id: kind
+            for sig_id, kind in (
+                (active_id, KIND_ACTIVE),
+                (color_id, KIND_COLOR),
+                (x_id, KIND_X),
+                (y_id, KIND_Y),
+            )
+            if sig_id is not None
+        }
+
+        # Frame N spans [starts[N], ends[N]); frames are independent
+        bounds = self._frame_boundaries(mm, vsync_id)
+        starts = [self._data_offset] + bounds
+        ends = bounds + [len(mm)]
+
+        # Every range yields at most one frame, so this bounds the frame count
+        slots = len(starts) if max_frames is None else min(max_frames, len(starts))
+        frames = np.zeros((slots, *self.frame_shape), dtype=np.uint8)
+        extents = np.zeros((slots, 5), dtype=np.int64)
+        count = 0
         pixel_count = 0
-        in_frame = False
-        prev_vsync = "1"
-
-        with open(self.vcd_path, "r") as f:
-            # Skip header
-            for line in f:
-                if line.startswith("$enddefinitions"):
-                    break
-
-            # Process value changes
-            current_state = {
-                "hsync": "1",
-                "vsync": "1",
-                "active": "0",
-                "color": "000000",
-                "x": 0,
-                "y": 0,
-            }
-
-            for line in f:
-                line = line.strip()
-                if not line:
+        executor = ProcessPoolExecutor(jobs) if jobs > 1 else None
+        self.complete = False
+        try:
+            i = 0
+            while i < len(starts) and count < slots:
+                # Only decode as many ranges as there are free slots
+                lo, hi = i, min(i + slots - count, len(starts))
+                i = hi
+                if executor:
+                    results = executor.map(
+                        self._decode_range, starts[lo:hi], ends[lo:hi]
+                    )
+                else:
+                    # Decode in-process into the next free slot; the generator
+                    # reads count lazily, after the previous result was taken
+                    results = (
+                        self._decode_mapped(mm, start, end, frames[count])
+                        for start, end in zip(starts[lo:hi], ends[lo:hi])
+                    )
+                for current_frame, extent in results:
+                    # A range without pixels would have been merged into the next
+                    # frame by a serial decoder; it contributes nothing either way
+                    if not extent[0]:
+                        continue
+                    if executor:
+                        frames[count] = current_frame
+                    extents[count] = extent
+                    count += 1
+                    pixel_count += int(extent[0])
+                    if count % 10 == 0:
+                        print(f"Extracted {count} frames ({pixel_count} pixels total)")
+                    # Slots are never reused once filled, so the view stays valid
+                    self.extents = extents[:count]
+                    yield frames[count - 1]
+            # Not reached if the consumer stops early
+            self.complete = i >= len(starts)
+            if max_frames is not None and count >= max_frames:
+                print(f"Reached frame limit: {max_frames}")
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
+            self.frames = frames[:count]
+            self.extents = extents[:count]
+
+        print(f"Extracted {count} total frames ({pixel_count} total pixels)")
+
+    def _frame_boundaries(self, mm: mmap.mmap, vsync_id: bytes) -> List[int]:
+        """Offsets of the value-change lines where vsync rises after being low"""
+        eol = self._eol
+        fall = eol + b"0" + vsync_id + eol
+        rise = eol + b"1" + vsync_id + eol
+
+        bounds = []
+        pos = self._data_offset - len(eol)
+        while True:
+            i = mm.find(fall, pos)
+            if i < 0:
+                break
+            i = mm.find(rise, i + 1)
+            if i < 0:
+                break
+            pos = i + len(eol)
+            bounds.append(pos)
+        return bounds
+
+    def _decode_range(self, start: int, end: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Worker process entry point: map the trace and decode [start, end)"""
+        current_frame = np.zeros(self.frame_shape, dtype=np.uint8)
+        with open(self.vcd_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            return self._decode_mapped(mm, start, end, current_frame)
+
+    def _decode_mapped(
+        self, mm: mmap.mmap, start: int, end: int, current_frame: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Decode the value changes in [start, end) into current_frame, which
+        must be zeroed. Returns the frame and its extent (see self.extents).
+        """
+        # active, x, y, frame_pixels, min x, min y, max x, max y
+        state = np.array(
+            [*self._seed_state(mm, start), 0, self.width, self.height, -1, -1],
+            dtype=np.int64,
+        )
+        if _scan_range_jit is not None and all(
+            len(sig_id) <= MAX_PACKED_ID_LEN for sig_id in self._kinds
+        ):
+            keys = [_pack_sig_id(sig_id) for sig_id in self._kinds]
+            buf = np.frombuffer(mm, dtype=np.uint8)
+            try:
+                _scan_range_jit(
+                    buf,
+                    start,
+                    end,
+                    np.array(keys, dtype=np.int64),
+                    np.array(list(self._kinds.values()), dtype=np.int64),
+                    current_frame,
+                    self.width,
+                    self.height,
+                    self.scale,
+                    state,
+                )
+            finally:
+                # Release the buffer export before the mmap is closed, even
+                # if the scan fails, so the real error is not masked
+                del buf
+        else:
+            self._scan_range_py(mm, start, end, current_frame, state)
+        return current_frame, state[3:].copy()
+
+    def _seed_state(self, mm: mmap.mmap, pos: int) -> Tuple[int, int, int]:
+        """Recover activevideo, x and y as they stand just before pos"""
+        eol = self._eol
+        active = x = y = 0
+        for sig_id, kind in self._kinds.items():
+            if kind == KIND_ACTIVE:
+                lo = self._data_offset - len(eol)
+                on = mm.rfind(eol + b"1" + sig_id + eol, lo, pos)
+                off = mm.rfind(eol + b"0" + sig_id + eol, lo, pos)
+                active = int(on > off)
+            elif kind == KIND_X or kind == KIND_Y:
+                val = _last_binary_value(
+                    mm, b" " + sig_id + eol, self._data_offset, pos
+                )
+                if val is None:
+                    continue
+                if kind == KIND_X:
+                    x = val
+                else:
+                    y = val
+        return active, x, y
+
+    def _scan_range_py(
+        self, mm: mmap.mmap, pos: int, end: int, current_frame: np.ndarray, state
+    ):
+        """Pure Python counterpart of _scan_range"""
+        kinds = self._kinds
+        width = self.width
+        height = self.height
+        scale = self.scale
+        active = bool(state[0])
+        x = int(state[1])
+        y = int(state[2])
+        frame_pixels = 0
+        min_x, min_y, max_x, max_y = (int(v) for v in state[4:])
+        # Binary value string -> int; color/x/y only take a few hundred values
+        bits_cache = {b"": 0}
+
+        # Blanking intervals carry no pixels; jump over them to the next
+        # activevideo rise, then recover the last x/y written in between
+        eol = self._eol
+        active_rise = None
+        pos_tails = []
+        for sig_id, kind in kinds.items():
+            if kind == KIND_ACTIVE:
+                active_rise = eol + b"1" + sig_id + eol
+            elif kind == KIND_X or kind == KIND_Y:
+                pos_tails.append((kind, b" " + sig_id + eol))
+
+        while pos < end:
+            # Restarted after each skipped blanking interval
+            for m in _VALUE_CHANGE_RE.finditer(mm, pos, end):
+                bit, value, sig_id = m.groups()
+                kind = kinds.get(sig_id)
+                if kind is None:
                     continue
 
-                # Skip timestamp markers
-                if line.startswith("#"):
+                if kind == KIND_ACTIVE:
+                    active = (bit or value) == b"1"
+                    if not active:
+                        start = m.end()
+                        pos = mm.find(active_rise, start - len(eol), end)
+                        pos = end if pos < 0 else pos + len(eol)
+                        for pos_kind, tail in pos_tails:
+                            val = _last_binary_value(mm, tail, start, pos)
+                            if val is None:
+                                continue
+                            if pos_kind == KIND_X:
+                                x = val
+                            else:
+                                y = val
+                        break
                     continue
 
-                # Parse signal changes: "0~#" or "b101010 "$"
-                if len(line) > 1 and line[0] in "01":
-                    sig_id = line[1:].strip()
-                    value = line[0]
-
-                    if sig_id == vsync_id:
-                        # Detect frame boundary (vsync falling edge)
-                        if prev_vsync == "0" and value == "1" and current_frame:
-                            frames.append(current_frame)
-                            current_frame = {}
-                            in_frame = False
-                            if len(frames) % 10 == 0:
-                                print(
-                                    f"Extracted {len(frames)} frames ({pixel_count} pixels total)"
-                                )
-                        prev_vsync = value
-                        current_state["vsync"] = value
-
-                    elif sig_id == active_id:
-                        current_state["active"] = value
-
-                elif line.startswith("b"):
-                    # Binary value: "b101010 $"
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        value_str = parts[0][1:]  # Remove 'b' prefix
-                        sig_id = parts[1]
-
-                        if sig_id == color_id and current_state["active"] == "1":
-                            # Convert binary to 6-bit color
-                            try:
-                                color_val = int(value_str, 2) if value_str else 0
-                                x = current_state["x"]
-                                y = current_state["y"]
-
-                                # Store pixel (deduplicate by position)
-                                current_frame[(x, y)] = color_val
-                                pixel_count += 1
-
-                                if pixel_count >= max_pixels:
-                                    if current_frame:
-                                        frames.append(current_frame)
-                                    print(f"Reached pixel limit: {max_pixels}")
-                                    return frames
-
-                            except ValueError:
-                                pass
-
-                        elif sig_id == x_id:
-                            try:
-                                current_state["x"] = (
-                                    int(value_str, 2) if value_str else 0
-                                )
-                            except ValueError:
-                                pass
-
-                        elif sig_id == y_id:
-                            try:
-                                current_state["y"] = (
-                                    int(value_str, 2) if value_str else 0
-                                )
-                            except ValueError:
-                                pass
-
-        # Add final frame if any
-        if current_frame:
-            frames.append(current_frame)
-
-        print(f"Extracted {len(frames)} total frames ({pixel_count} total pixels)")
-        return frames
+                # Multi-bit signals: color, x, y. The pattern only admits 0/1
+                # digits and the empty string is pre-seeded, so int() can't fail
+                val = bits_cache.get(value)
+                if val is None:
+                    val = bits_cache[value] = int(value, 2)
+
+                if kind == KIND_COLOR:
+                    if active and x < width and y < height:
+                        # Count every pixel so frame numbering ignores scale
+                        frame_pixels += 1
+                        if x < min_x:
+                            min_x = x
+                        if x > max_x:
+                            max_x = x
+                        if y < min_y:
+                            min_y = y
+                        if y > max_y:
+                            max_y = y
+                        if not (x % scale or y % scale):
+                            current_frame[y // scale, x // scale] = val
+                elif kind == KIND_X:
+                    x = val
+                else:
+                    y = val
+            else:
+                break
+
+        state[0] = active
+        state[1] = x
+        state[2] = y
+        state[3] = frame_pixels
+        state[4:] = min_x, min_y, max_x, max_y
+
+
+def _last_binary_value(
+    mm: mmap.mmap, tail: bytes, start: int, end: int
+) -> Optional[int]:
+    """
+    Value of the last "b<bits><tail>" line in [start, end), where tail is
+    " <id><eol>". Lines holding x/z bits are skipped like the decoders do.
+    """
+    while True:
+        i = mm.rfind(tail, start, end)
+        if i < 0:
+            return None
+        line_start = max(mm.rfind(b"\n", start, i) + 1, start)
+        try:
+            # Skip the line's leading 'b'
+            return int(mm[line_start + 1 : i], 2)
+        except ValueError:
+            end = line_start
+
+
+def _pack_sig_id(sig_id: bytes) -> int:
+    """Pack a short VCD identifier into an int, matching _scan_range"""
+    key = 0
+    for c in sig_id:
+        key = (key << 8) | c
+    return key
+
+
+def _scan_range(buf, pos, end, keys, codes, fb, width, height, scale, state):
+    """
+    Decode the value changes in buf[pos:end] into fb, keeping every scale-th
+    pixel of a width x height display. The decoder state (active, x, y,
+    pixels written, extent of the written pixels) is read from and written
+    back to state.
+    """
+    active = state[0]
+    x = state[1]
+    y = state[2]
+    frame_pixels = state[3]
+    min_x = state[4]
+    min_y = state[5]
+    max_x = state[6]
+    max_y = state[7]
+
+    while pos < end:
+        c = buf[pos]
+        val = 0
+        valid = True
+        if c == 98:  # b101010 $
+            pos += 1
+            while pos < end and buf[pos] > 32:
+                d = buf[pos] - 48
+                if d == 0 or d == 1:
+                    val = (val << 1) | d
+                else:
+                    valid = False
+                pos += 1
+            while pos < end and (buf[pos] == 32 or buf[pos] == 9):
+                pos += 1
+        elif c == 48 or c == 49:  # 0~#
+            val = c - 48
+            pos += 1
+        else:
+            # Timestamp markers and directives
+            while pos < end and buf[pos] != 10:
+                pos += 1
+            pos += 1
+            continue
+
+        key = 0
+        key_len = 0
+        while pos < end and buf[pos] > 32:
+            key = (key << 8) | buf[pos]
+            key_len += 1
+            pos += 1
+        while pos < end and buf[pos] != 10:
+            pos += 1
+        pos += 1
+
+        if not valid or key_len == 0 or key_len > MAX_PACKED_ID_LEN:
+            continue
+        kind = -1
+        for i in range(keys.shape[0]):
+            if keys[i] == key:
+                kind = codes[i]
+                break
+
+        if kind == KIND_ACTIVE:
+            active = val
+        elif kind == KIND_COLOR:
+            if active and x < width and y < height:
+                frame_pixels += 1
+                min_x = min(min_x, x)
+                min_y = min(min_y, y)
+                max_x = max(max_x, x)
+                max_y = max(max_y, y)
+                if x % scale == 0 and y % scale == 0:
+                    fb[y // scale, x // scale] = val
+        elif kind == KIND_X:
+            x = val
+        elif kind == KIND_Y:
+            y = val
+
+    state[0] = active
+    state[1] = x
+    state[2] = y
+    state[3] = frame_pixels
+    state[4] = min_x
+    state[5] = min_y
+    state[6] = max_x
+    state[7] = max_y
+
+
+_scan_range_jit = njit(cache=True, nogil=True)(_scan_range) if njit else None
+
+
+def _build_rgb_lut() -> np.ndarray:
+    """Build the 64-entry RRGGBB -> 24-bit RGB lookup table"""
+    lut = np.empty((64, 3), dtype=np.uint8)
+    for rrggbb in range(64):
+        rr = (rrggbb >> 4) & 0x3
+        gg = (rrggbb >> 2) & 0x3
+        bb = rrggbb & 0x3
+
+        # Scale 2-bit to 8-bit (0-3 -> 0-255)
+        lut[rrggbb] = ((rr * 255) // 3, (gg * 255) // 3, (bb * 255) // 3)
+    return lut
+
+
+# Indexing with a whole framebuffer (_RGB_LUT[frame]) yields an (H, W, 3) image
+_RGB_LUT = _build_rgb_lut()
+
+# Same colors packed as opaque 0xAARRGGBB, for 32-bit framebuffer surfaces
+_ARGB_LUT = (
+    np.uint32(0xFF000000)
+    | (_RGB_LUT[:, 0].astype(np.uint32) << 16)
+    | (_RGB_LUT[:, 1].astype(np.uint32) << 8)
+    | _RGB_LUT[:, 2].astype(np.uint32)
+)
 
 
 def rrggbb_to_rgb(rrggbb: int) -> Tuple[int, int, int]:
     """Convert 6-bit RRGGBB to 24-bit RGB"""
-    rr = (rrggbb >> 4) & 0x3
-    gg = (rrggbb >> 2) & 0x3
-    bb = rrggbb & 0x3
+    return tuple(_RGB_LUT[rrggbb & 0x3F].tolist())
 
-    # Scale 2-bit to 8-bit (0-3 -> 0-255)
-    r = (rr * 255) // 3
-    g = (gg * 255) // 3
-    b = (bb * 255) // 3
 
-    return (r, g, b)
+# ANSI 24-bit true color prefix + Unicode block character for each RRGGBB code
+_ANSI = ["\033[38;2;{};{};{}m█".format(*rgb) for rgb in _RGB_LUT.tolist()]
 
 
 def render_frame_terminal(
-    frame: dict, width: int = 640, height: int = 480, scale: int = 2
-):
-    """Render frame to terminal using ANSI escape codes"""
-    # Use Unicode block characters for better resolution
-    BLOCK = "█"
-
-    # Find actual frame bounds
-    if not frame:
-        print("Empty frame")
-        return
-
-    xs = [x for x, y in frame.keys()]
-    ys = [y for x, y in frame.keys()]
-
-    if not xs or not ys:
-        print("No pixel data")
-        return
-
-    min_x, max_x = min(xs), max(xs)
-    min_y, max_y = min(ys), max(ys)
-
-    print(
-        f"\nFrame bounds: X[{min_x}:{max_x}] Y[{min_y}:{max_y}] ({len(frame)} pixels)"
-    )
-
-    # Render with scaling
-    for y in range(min_y, max_y + 1, scale):
-        line = ""
-        for x in range(min_x, max_x + 1, scale):
-            color_val = frame.get((x, y), 0)
-            r, g, b = rrggbb_to_rgb(color_val)
-
-            # ANSI 24-bit true color
-            line += f"\033[38;2;{r};{g};{b}m{BLOCK}\033[0m"
-
-        print(line)
-
-
-def render_frame_png(
-    frame: dict, output_path: str, width: int = 640, height: int = 480
+    frame: np.ndarray, scale: int = 1, extent: Optional[np.ndarray] = None
 ):
+    """
+    Render frame to terminal using ANSI escape codes, one block per pixel.
+    Downscale by parsing with VCDParser(scale=...) and pass the same scale
+    here. With the frame's extent from VCDParser.extents, only the drawn
+    area is shown.
+    """
+    if extent is None:
+        height, width = frame.shape
+        lines = [f"\nFrame: {width}x{height}"]
+        crop = frame
+    else:
+        # Crop to the drawn area so short traces do not print a blank canvas
+        pixels, min_x, min_y, max_x, max_y = (int(v) for v in extent)
+        # Frame cells kept by the parser inside the drawn area
+        crop = frame[
+            -(-min_y // scale) : max_y // scale + 1,
+            -(-min_x // scale) : max_x // scale + 1,
+        ]
+        if not crop.size:
+            print("Empty frame")
+            return
+        lines = [
+            f"\nFrame bounds: X[{min_x}:{max_x}] Y[{min_y}:{max_y}] ({pixels} pixels)"
+        ]
+    # One reset per row is enough to restore the color
+    lines.extend("".join([_ANSI[c] for c in row]) + "\033[0m" for row in crop.tolist())
+
+    # Emit the whole frame with one write and one flush
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def render_frame_argb(frame: np.ndarray) -> np.ndarray:
+    """
+    Render frame to an (H, W) uint32 array of 0xAARRGGBB pixels, ready to
+    copy into 32-bit surfaces (SDL, pygame, canvas)
+    """
+    return _ARGB_LUT[frame]
+
+
+# Pillow formats that can store a "P" image as-is
+_PALETTE_FORMATS = {"PNG", "GIF", "BMP", "TIFF"}
+
+
+def render_frame_png(frame: np.ndarray, output_path: str):
     """Render frame to PNG image"""
-    try:
-        from PIL import Image
-    except ImportError:
+    if Image is None:
         print(
             "Error: PIL (Pillow) not installed. Install with: pip install Pillow",
             file=sys.stderr,
         )
         return False
 
-    img = Image.new("RGB", (width, height), color="black")
-    pixels = img.load()
-
-    for (x, y), color_val in frame.items():
-        if 0 <= x < width and 0 <= y < height:
-            r, g, b = rrggbb_to_rgb(color_val)
-            pixels[x, y] = (r, g, b)
-
+    # Wrap the framebuffer itself as a palette image (shared memory, no copy)
+    # with the RRGGBB table as its palette, instead of expanding it to RGB
+    height, width = frame.shape
+    img = Image.frombuffer(
+        "P", (width, height), np.ascontiguousarray(frame), "raw", "P", 0, 1
+    )
+    img.putpalette(_RGB_LUT.tobytes())
+    # Formats without palette support (JPEG, ...) need the RGB expansion
+    ext = Path(output_path).suffix.lower()
+    if Image.registered_extensions().get(ext) not in _PALETTE_FORMATS:
+        img = img.convert("RGB")
     img.save(output_path)
     print(f"Saved frame to: {output_path}")
     return True
 
 
+def _png_writer(png_queue: queue.Queue, failed: List[str]):
+    """
+    Save (frame, path) items from png_queue until a None item arrives,
+    appending the paths that could not be saved to failed. Keeps draining
+    after an error so the producer never blocks on a full queue.
+    """
+    while True:
+        item = png_queue.get()
+        if item is None:
+            return
+        try:
+            render_frame_png(*item)
+        except Exception as e:
+            print(f"Error: could not save {item[1]}: {e}", file=sys.stderr)
+            failed.append(item[1])
+
+
+def _cache_meta_path(cache_path: Path) -> Path:
+    """Sidecar holding the per-frame extents and completeness of a frame cache"""
+    return cache_path.with_suffix(".meta.npz")
+
+
+def load_frame_cache(
+    cache_path: Path, vcd_path: Path, min_frames: int, frame_shape: Tuple[int, int]
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Memory-map frames cached by an earlier run and load their extents, or
+    return None if the cache is missing, older than the trace, or does not
+    cover the request. A cache of the whole trace covers any request.
+    """
+    meta_path = _cache_meta_path(cache_path)
+    try:
+        mtime = vcd_path.stat().st_mtime
+        if cache_path.stat().st_mtime < mtime or meta_path.stat().st_mtime < mtime:
+            return None
+        frames = np.load(cache_path, mmap_mode="r")
+        with np.load(meta_path) as meta:
+            extents = meta["extents"]
+            complete = bool(meta["complete"])
+    except (OSError, ValueError, KeyError):
+        return None
+
+    if (
+        frames.ndim != 3
+        or frames.dtype != np.uint8
+        or frames.shape[1:] != frame_shape
+        or extents.shape != (len(frames), 5)
+        or (len(frames) < min_frames and not complete)
+    ):
+        return None
+    return frames, extents
+
+
+def save_frame_cache(
+    cache_path: Path, frames: np.ndarray, extents: np.ndarray, complete: bool
+):
+    """
+    Write extracted frames and their extents next to the trace for later
+    runs. complete marks frames as every frame in the trace.
+    """
+    try:
+        np.save(cache_path, frames)
+        np.savez(_cache_meta_path(cache_path), extents=extents, complete=complete)
+    except OSError as e:
+        print(f"Warning: could not write frame cache: {e}", file=sys.stderr)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Render VGA frames from VCD trace")
     parser.add_argument("vcd_file", help="Input VCD trace file")
@@ -250,46 +689,119 @@ def main():
         "--frames", type=int, default=1, help="Number of frames to render"
     )
     parser.add_argument(
-        "--output", "-o", help="Output PNG file (if not specified, render to terminal)"
+        "--start-frame",
+        type=int,
+        default=0,
+        help="Index of the first frame to render (served from the frame cache)",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        help="Output image file, e.g. out.png (if not specified, render to terminal)",
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=2,
+        help="Scale factor for terminal rendering (applied while parsing)",
     )
     parser.add_argument(
-        "--scale", type=int, default=2, help="Scale factor for terminal rendering"
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Worker processes for decoding frames in parallel",
     )
     parser.add_argument(
-        "--max-pixels", type=int, default=500000, help="Maximum pixels to extract"
+        "--no-cache",
+        action="store_true",
+        help="Re-parse the VCD instead of using the cached .frames.npy",
     )
 
     args = parser.parse_args()
+    if args.frames < 1:
+        parser.error("--frames must be at least 1")
+    if args.start_frame < 0:
+        parser.error("--start-frame must not be negative")
 
     if not Path(args.vcd_file).exists():
         print(f"Error: VCD file not found: {args.vcd_file}", file=sys.stderr)
         return 1
 
-    print(f"Parsing VCD file: {args.vcd_file}")
-
-    parser = VCDParser(args.vcd_file)
-    frames = parser.extract_frames(max_pixels=args.max_pixels)
-
-    if not frames:
+    # The terminal only shows every scale-th pixel, so decode just those;
+    # PNG export keeps full resolution. Each scale gets its own cache.
+    scale = 1 if args.output else max(args.scale, 1)
+    parser = VCDParser(args.vcd_file, scale=scale)
+    vcd_path = Path(args.vcd_file)
+    suffix = ".frames.npy" if scale == 1 else f".frames.x{scale}.npy"
+    cache_path = Path(args.vcd_file + suffix)
+    # Frames needed to cover [start_frame, start_frame + frames)
+    needed = args.start_frame + args.frames
+    frames = None
+    if not args.no_cache:
+        cached = load_frame_cache(cache_path, vcd_path, needed, parser.frame_shape)
+        if cached is not None:
+            frames, extents = cached
+
+    if frames is not None:
+        print(f"Loaded {len(frames)} cached frame(s) from: {cache_path}")
+        frame_iter = iter(frames[:needed])
+    else:
+        print(f"Parsing VCD file: {args.vcd_file}")
+        frame_iter = parser.iter_frames(max_frames=needed, jobs=args.jobs)
+
+    writer = None
+    failed = []
+    if args.output:
+        # Encode PNGs on a separate thread while decoding continues; Pillow
+        # releases the GIL while compressing
+        png_queue = queue.Queue(maxsize=4)
+        writer = threading.Thread(target=_png_writer, args=(png_queue, failed))
+        writer.start()
+
+    total = 0
+    try:
+        for i, frame in enumerate(frame_iter):
+            # Never render past the requested range, whatever the source
+            if i >= needed:
+                break
+            total += 1
+            if i < args.start_frame:
+                continue
+
+            print(f"\n{'='*60}")
+            print(f"Frame {i}")
+            print(f"{'='*60}")
+
+            if args.output:
+                output_path = args.output
+                if args.frames > 1 or args.start_frame:
+                    # out.jpg -> out_frame3.jpg, whatever the format
+                    out = Path(args.output)
+                    output_path = str(out.with_name(f"{out.stem}_frame{i}{out.suffix}"))
+                png_queue.put((frame, output_path))
+            else:
+                extent = extents[i] if frames is not None else parser.extents[i]
+                render_frame_terminal(frame, scale, extent)
+    finally:
+        if writer:
+            png_queue.put(None)
+            writer.join()
+
+    if frames is None and len(parser.frames):
+        save_frame_cache(cache_path, parser.frames, parser.extents, parser.complete)
+
+    if failed:
+        return 1
+    if not total:
         print("Error: No frames extracted from VCD", file=sys.stderr)
         return 1
-
-    print(f"\nRendering {min(args.frames, len(frames))} frame(s)...")
-
-    for i, frame in enumerate(frames[: args.frames]):
-        print(f"\n{'='*60}")
-        print(f"Frame {i}")
-        print(f"{'='*60}")
-
-        if args.output:
-            output_path = (
-                args.output.replace(".png", f"_frame{i}.png")
-                if len(frames) > 1
-                else args.output
-            )
-            render_frame_png(frame, output_path)
-        else:
-            render_frame_terminal(frame, scale=args.scale)
+    if total <= args.start_frame:
+        print(
+            f"Error: Trace has no frame {args.start_frame} to render",
+            file=sys.stderr,
+        )
+        return 1
 
     return 0
 